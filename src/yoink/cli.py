@@ -1,26 +1,131 @@
-import argparse
 import os
 import pathlib
-import shutil
 import sys
-from typing import Optional
+import types
+from typing import Dict, List, Optional, Tuple
 
-from .config import PACKAGE_CACHE_BASE
+from .config import PACKAGE_CACHE_BASE, PKG_NAME_SANITIZE_TABLE
 from .pms.base import PackageManager
 from .yoink_engine import (
+    discard_dir,
     parse_package_spec,
+    find_bin_dirs,
     find_executable_in_prefix,
-    yoink_package,
+    find_present_subdirs,
+    read_yoinked_marker,
+    versioned_pkg_names,
+    yoink_packages_batch,
     purge_cache,
 )
 
 
-def main():
+# Candidates are checked against cached listings of lib/ and usr/lib/, so the
+# other architectures' multiarch dirs cost dict lookups, not stats.
+_LIB_DIRS = (
+    "lib",
+    "lib64",
+    "usr/lib",
+    "usr/lib64",
+    "lib/x86_64-linux-gnu",
+    "lib/aarch64-linux-gnu",
+    "lib/arm-linux-gnueabihf",
+    "usr/lib/x86_64-linux-gnu",
+    "usr/lib/aarch64-linux-gnu",
+    "usr/lib/arm-linux-gnueabihf",
+)
+
+_SHORT_USAGE = (
+    "usage: yoink [--purge-cache] [--no-cache] [--verbose] [-p PACKAGE_SPEC] "
+    "PACKAGE_SPEC [ARGS...] (see 'yoink --help')\n"
+)
+
+_ACTIVE_PM_FILE = PACKAGE_CACHE_BASE / ".active_pm"
+
+
+def _get_pm() -> Tuple[Optional[PackageManager], bool]:
+    """
+    Returns the package manager to use and whether it was taken from the name
+    remembered in _ACTIVE_PM_FILE by an earlier run, skipping detection.
+    A freshly detected package manager is remembered for the next run.
+    """
+    if os.environ.get("YOINK_PM"):
+        return PackageManager.get_active(), False
+
+    try:
+        remembered_pm = PackageManager.get_registered(
+            _ACTIVE_PM_FILE.read_text().strip()
+        )
+    except OSError:
+        remembered_pm = None
+    if remembered_pm:
+        return remembered_pm, True
+
+    active_pm = PackageManager.get_active()
+    if active_pm:
+        tmp_file = _ACTIVE_PM_FILE.with_name(f"{_ACTIVE_PM_FILE.name}.{os.getpid()}")
+        try:
+            tmp_file.write_text(f"{active_pm.name}\n")
+            os.replace(tmp_file, _ACTIVE_PM_FILE)
+        except OSError:
+            pass
+    return active_pm, False
+
+
+def _forget_pm() -> None:
+    """Drops the remembered package manager so the next run detects it again."""
+    try:
+        _ACTIVE_PM_FILE.unlink()
+    except OSError:
+        pass
+
+
+def _scan_prefix_once(install_prefix: pathlib.Path) -> Tuple[bool, bool]:
+    """
+    Scans the top level of install_prefix once, returning whether it holds any
+    executable files and whether it holds any shared libraries ('.so' files).
+    """
+    has_executable = False
+    has_shared_lib = False
+    try:
+        with os.scandir(install_prefix) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if not has_shared_lib and ".so" in entry.name:
+                    has_shared_lib = True
+                if not has_executable and os.access(entry.path, os.X_OK):
+                    has_executable = True
+                if has_executable and has_shared_lib:
+                    break
+    except OSError:
+        pass
+    return has_executable, has_shared_lib
+
+
+def _compute_env_prepend(
+    present_dirs: List[str], prefix_str: str, prefix_has_relevant_files: bool
+) -> str:
+    """
+    Returns the os.pathsep-joined entries to prepend to a path-list variable:
+    present_dirs, plus the prefix itself if it directly holds relevant files,
+    de-duplicated in order. Returns an empty string if there are none.
+    """
+    entries = list(present_dirs)
+    if prefix_has_relevant_files:
+        entries.append(prefix_str)
+    return os.pathsep.join(dict.fromkeys(entries))
+
+
+def _build_parser():
+    # Imported here: argparse is only needed off the fast path in _parse_args.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Yoink - Minimal npx-like tool for temporary system packages.",
         epilog="Examples:\n"
         "  yoink cowsay 'Moo!'\n"
         "  yoink sl\n"
+        "  yoink -p libfoo -p libbar foo-tool (fetch extra packages in one batch)\n"
         "  yoink --purge-cache\n"
         "  yoink htop@3.3.0 (version syntax depends on your system's package manager)\n",
         formatter_class=argparse.RawTextHelpFormatter,
@@ -30,6 +135,20 @@ def main():
         action="store_true",
         help="Remove all yoinked packages and data, then exit.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached installs and archives; re-download and re-extract packages.",
+    )
+    parser.add_argument(
+        "--package",
+        "-p",
+        dest="extra_package_specs",
+        action="append",
+        default=[],
+        metavar="PACKAGE_SPEC",
+        help="Extra package to yoink alongside package_spec in the same download (repeatable).",
+    )
     parser.add_argument(
         "package_spec",
         nargs="?",
@@ -43,8 +162,29 @@ def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed diagnostic output."
     )
+    return parser
+
+
+def _parse_args(argv: List[str]):
+    """
+    Parses command-line arguments. The common 'yoink <package> [args...]' form
+    is handled without argparse, which would parse it identically since every
+    argument after package_spec belongs to the yoinked command.
+    """
+    if argv and not argv[0].startswith("-") and "--" not in argv:
+        return types.SimpleNamespace(
+            purge_cache=False,
+            no_cache=False,
+            extra_package_specs=[],
+            package_spec=argv[0],
+            command_args=argv[1:],
+            verbose=False,
+        )
+    return _build_parser().parse_args(argv)
 
-    args = parser.parse_args()
+
+def main():
+    args = _parse_args(sys.argv[1:])
 
     try:
         PACKAGE_CACHE_BASE.mkdir(parents=True, exist_ok=True)
@@ -60,10 +200,10 @@ def main():
         sys.exit(0)
 
     if not args.package_spec:
-        parser.print_help(sys.stderr)
+        sys.stderr.write(_SHORT_USAGE)
         sys.exit(1)
 
-    active_pm = PackageManager.get_active()
+    active_pm, pm_is_remembered = _get_pm()
     if not active_pm:
         print(
             "❌ No supported package manager (apt, dnf, pacman) found or functional on this system.",
@@ -74,7 +214,20 @@ def main():
     if args.verbose:
         print(f"🔧 Using package manager: {active_pm.name}", file=sys.stderr)
 
+    # Create the fixed scaffold once so the engine only needs leaf mkdirs.
+    try:
+        os.makedirs(PACKAGE_CACHE_BASE / active_pm.name, exist_ok=True)
+        os.makedirs(PACKAGE_CACHE_BASE / "downloads", exist_ok=True)
+    except OSError as e:
+        print(
+            f"❌ Error creating cache directories in {PACKAGE_CACHE_BASE}: {e}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
     pkg_name_base, pkg_version_requested = parse_package_spec(args.package_spec)
+    extra_pkg_specs = [parse_package_spec(spec) for spec in args.extra_package_specs]
+    all_pkg_specs = [(pkg_name_base, pkg_version_requested)] + extra_pkg_specs
 
     command_to_run = pkg_name_base
     command_run_args = args.command_args
@@ -91,33 +244,69 @@ def main():
             file=sys.stderr,
         )
 
-    safe_pkg_name_for_dir = pkg_name_base.replace("/", "_").replace(":", "_")
+    safe_pkg_name_for_dir = pkg_name_base.translate(PKG_NAME_SANITIZE_TABLE)
 
     version_suffix = f"@{pkg_version_requested}" if pkg_version_requested else "_latest"
     cache_subdir_name = f"{safe_pkg_name_for_dir}{version_suffix}"
+    for extra_name, extra_version in sorted(extra_pkg_specs, key=lambda s: s[0]):
+        safe_extra_name = extra_name.translate(PKG_NAME_SANITIZE_TABLE)
+        cache_subdir_name += (
+            f"+{safe_extra_name}@{extra_version}" if extra_version else f"+{safe_extra_name}"
+        )
 
+    # Resolved once; everything below reuses it instead of calling resolve() again.
     install_prefix = (PACKAGE_CACHE_BASE / active_pm.name / cache_subdir_name).resolve()
+    resolved_install_prefix_str = str(install_prefix)
 
     executable_path: Optional[pathlib.Path] = None
+    bin_dirs: Optional[List[str]] = None
+    # Directory listings of install_prefix, shared by the bin and lib lookups.
+    prefix_listings: Dict[str, Dict[str, bool]] = {}
     yoink_is_needed = True
-
+    is_yoinked = False
     if pkg_version_requested:
         if args.verbose:
             print(
                 f"🔧 Version '{pkg_version_requested}' specifically requested for {pkg_name_base}.",
                 file=sys.stderr,
             )
+        # Reused only if the marker shows this exact set of versions was installed.
+        is_yoinked, executable_path = read_yoinked_marker(
+            install_prefix,
+            active_pm.name,
+            versioned_pkg_names(active_pm, all_pkg_specs),
+        )
+        cache_label = f"{pkg_name_base}@{pkg_version_requested}"
+    else:
+        is_yoinked, executable_path = read_yoinked_marker(install_prefix)
+        cache_label = f"{pkg_name_base} (latest)"
+
+    if args.no_cache:
+        # A fresh copy was asked for, so the extracted prefix isn't reused either.
+        if install_prefix.exists():
+            if args.verbose:
+                print(
+                    f"🗑️ --no-cache given; removing cached {cache_label} at {install_prefix}.",
+                    file=sys.stderr,
+                )
+            discard_dir(install_prefix)
+        yoink_is_needed = True
+    elif pkg_version_requested and not is_yoinked:
         if install_prefix.exists():
             if args.verbose:
                 print(
                     f"🗑️ Removing existing versioned cache for {pkg_name_base}@{pkg_version_requested} at {install_prefix} to ensure fresh fetch.",
                     file=sys.stderr,
                 )
-            shutil.rmtree(install_prefix)
+            discard_dir(install_prefix)
 
         yoink_is_needed = True
-    elif install_prefix.exists() and (install_prefix / ".yoinked").is_file():
-        executable_path = find_executable_in_prefix(install_prefix, command_to_run)
+    elif is_yoinked:
+        if not executable_path:
+            bin_dirs = find_bin_dirs(install_prefix, prefix_listings)
+            executable_path = find_executable_in_prefix(
+                install_prefix, command_to_run, bin_dirs
+            )
         if executable_path:
             relative_cache_path = (
                 install_prefix.relative_to(PACKAGE_CACHE_BASE)
@@ -135,11 +324,11 @@ def main():
         else:
             if args.verbose:
                 print(
-                    f"🤔 Cache for {pkg_name_base} (latest) at {install_prefix} exists with .yoinked, "
+                    f"🤔 Cache for {cache_label} at {install_prefix} exists with .yoinked, "
                     f"but its command '{command_to_run}' not found. Re-yoinking.",
                     file=sys.stderr,
                 )
-            shutil.rmtree(install_prefix)
+            discard_dir(install_prefix)
             yoink_is_needed = True
     else:
         if install_prefix.exists():
@@ -149,24 +338,35 @@ def main():
                     f"(no .yoinked marker). Re-yoinking.",
                     file=sys.stderr,
                 )
-            shutil.rmtree(install_prefix)
+            discard_dir(install_prefix)
         yoink_is_needed = True
 
     if yoink_is_needed:
-        if not yoink_package(
+        is_successful_yoink, executable_path = yoink_packages_batch(
             active_pm,
-            pkg_name_base,
-            pkg_version_requested,
+            all_pkg_specs,
             install_prefix,
             args.verbose,
-        ):
+            use_archive_cache=not args.no_cache,
+        )
+        if not is_successful_yoink:
+            if pm_is_remembered:
+                # The remembered package manager may have been uninstalled.
+                _forget_pm()
             print(
-                f"❌ Failed to yoink {pkg_name_base}{'@' + pkg_version_requested if pkg_version_requested else ''}. See messages above.",
+                f"❌ Failed to yoink {', '.join([args.package_spec] + args.extra_package_specs)}. See messages above.",
                 file=sys.stderr,
             )
             sys.exit(1)
 
-        executable_path = find_executable_in_prefix(install_prefix, command_to_run)
+        # The prefix was just (re)populated, so earlier listings are stale.
+        prefix_listings = {}
+        if not executable_path:
+            # Extraction normally reports the executable; rescan only if it didn't.
+            bin_dirs = find_bin_dirs(install_prefix, prefix_listings)
+            executable_path = find_executable_in_prefix(
+                install_prefix, command_to_run, bin_dirs
+            )
         if not executable_path:
             print(
                 f"❌ Command '{command_to_run}' (from package '{pkg_name_base}') not found in {install_prefix} after yoinking.",
@@ -190,106 +390,45 @@ def main():
         )
         sys.exit(1)
 
-    current_env = os.environ.copy()
-
-    potential_bin_dirs_relative = [
-        "bin",
-        "usr/bin",
-        "sbin",
-        "usr/sbin",
-        "usr/local/bin",
-    ]
-    collected_path_entries_str = []
-    for d_name in potential_bin_dirs_relative:
-        abs_dir_path = install_prefix / d_name
-        if abs_dir_path.is_dir():
-            collected_path_entries_str.append(str(abs_dir_path.resolve()))
-
-    resolved_install_prefix_str = str(install_prefix.resolve())
-    if (
-        install_prefix.is_dir()
-        and resolved_install_prefix_str not in collected_path_entries_str
-    ):
-        if any(
-            os.access(item, os.X_OK)
-            for item in install_prefix.iterdir()
-            if item.is_file()
-        ):
-            collected_path_entries_str.append(resolved_install_prefix_str)
-
-    unique_ordered_new_path_entries = []
-    seen_paths_for_path_var = set()
-    for p_str in collected_path_entries_str:
-        if p_str not in seen_paths_for_path_var:
-            unique_ordered_new_path_entries.append(p_str)
-            seen_paths_for_path_var.add(p_str)
-
-    if unique_ordered_new_path_entries:
-        current_env["PATH"] = (
-            os.pathsep.join(unique_ordered_new_path_entries)
-            + os.pathsep
-            + current_env.get("PATH", "")
-        )
-        if args.verbose:
-            print(
-                f"🔧 Environment PATH prepended with: {os.pathsep.join(unique_ordered_new_path_entries)}",
-                file=sys.stderr,
-            )
-    elif args.verbose:
-        print(
-            f"🔧 No additional bin directories found in {install_prefix} to add to PATH.",
-            file=sys.stderr,
+    if bin_dirs is None:
+        bin_dirs = find_bin_dirs(install_prefix, prefix_listings)
+    lib_dirs = find_present_subdirs(install_prefix, _LIB_DIRS, prefix_listings)
+    # Packages with standard bin/lib dirs practically never also keep files at
+    # the top level, so the prefix itself is only scanned when one is missing.
+    prefix_has_executable = prefix_has_shared_lib = False
+    if not bin_dirs or not lib_dirs:
+        prefix_has_executable, prefix_has_shared_lib = _scan_prefix_once(
+            install_prefix
         )
 
-    potential_lib_dir_names = [
-        "lib",
-        "lib64",
-        "usr/lib",
-        "usr/lib64",
-        "lib/x86_64-linux-gnu",
-        "lib/aarch64-linux-gnu",
-        "lib/arm-linux-gnueabihf",
-        "usr/lib/x86_64-linux-gnu",
-        "usr/lib/aarch64-linux-gnu",
-        "usr/lib/arm-linux-gnueabihf",
-    ]
-    collected_ld_lib_paths_str = []
-    for lib_dir_name in potential_lib_dir_names:
-        abs_lib_dir = install_prefix / lib_dir_name
-        if abs_lib_dir.is_dir():
-            collected_ld_lib_paths_str.append(str(abs_lib_dir.resolve()))
-
-    if (
-        install_prefix.is_dir()
-        and resolved_install_prefix_str not in collected_ld_lib_paths_str
+    env_overrides: Dict[str, str] = {}
+    for var_name, present_dirs, prefix_has_relevant_files, dir_kind in (
+        ("PATH", bin_dirs, not bin_dirs and prefix_has_executable, "bin"),
+        (
+            "LD_LIBRARY_PATH",
+            lib_dirs,
+            not lib_dirs and prefix_has_shared_lib,
+            "library",
+        ),
     ):
-        if any(
-            item.is_file() and ".so" in item.name for item in install_prefix.iterdir()
-        ):
-            collected_ld_lib_paths_str.append(resolved_install_prefix_str)
-
-    unique_ordered_new_ld_lib_paths = []
-    seen_ld_paths = set()
-    for p_str in collected_ld_lib_paths_str:
-        if p_str not in seen_ld_paths:
-            unique_ordered_new_ld_lib_paths.append(p_str)
-            seen_ld_paths.add(p_str)
-
-    if unique_ordered_new_ld_lib_paths:
-        existing_ld_path = current_env.get("LD_LIBRARY_PATH", "")
-        current_env["LD_LIBRARY_PATH"] = os.pathsep.join(
-            unique_ordered_new_ld_lib_paths
-        ) + (os.pathsep + existing_ld_path if existing_ld_path else "")
-        if args.verbose:
+        new_entries = _compute_env_prepend(
+            present_dirs, resolved_install_prefix_str, prefix_has_relevant_files
+        )
+        if new_entries:
+            existing_value = os.environ.get(var_name, "")
+            env_overrides[var_name] = new_entries + (
+                os.pathsep + existing_value if existing_value else ""
+            )
+            if args.verbose:
+                print(
+                    f"🔧 Environment {var_name} prepended with: {new_entries}",
+                    file=sys.stderr,
+                )
+        elif args.verbose:
             print(
-                f"🔧 Environment LD_LIBRARY_PATH prepended with: {os.pathsep.join(unique_ordered_new_ld_lib_paths)}",
+                f"🔧 No additional {dir_kind} directories found in {install_prefix} to add to {var_name}.",
                 file=sys.stderr,
             )
-    elif args.verbose:
-        print(
-            f"🔧 No additional library directories found in {install_prefix} to add to LD_LIBRARY_PATH.",
-            file=sys.stderr,
-        )
 
     full_command_to_exec = [str(executable_path)] + command_run_args
     if args.verbose:
@@ -298,8 +437,11 @@ def main():
             file=sys.stderr,
         )
 
+    # The process is replaced by exec, so updating os.environ in place (which
+    # also calls putenv) hands the overrides to the child without a copy.
+    os.environ.update(env_overrides)
     try:
-        os.execvpe(str(executable_path), full_command_to_exec, current_env)
+        os.execv(str(executable_path), full_command_to_exec)
     except OSError as e:
         print(
             f"❌ Failed to execute '{command_to_run}' (from {executable_path}): {e}",
@@ -1,3 +1,6 @@
 import pathlib
 
 PACKAGE_CACHE_BASE = pathlib.Path("/tmp/yoink")
+
+# Turns a package name into a single path component (e.g. apt's 'foo:i386').
+PKG_NAME_SANITIZE_TABLE = str.maketrans({"/": "_", ":": "_"})
@@ -3,6 +3,35 @@ from typing import List, Optional, Tuple
 
 from .base import PackageManager, register_pm
 
+# tar flags for each data member, and the external program tar runs for them
+# (dpkg-deb decompresses in-process, so it may be installed when this is not).
+_DATA_TAR_FLAGS = {
+    "data.tar": ([], None),
+    "data.tar.gz": (["-z"], "gzip"),
+    "data.tar.xz": (["-J"], "xz"),
+    "data.tar.bz2": (["-j"], "bzip2"),
+    "data.tar.zst": (["--zstd"], "zstd"),
+}
+
+
+def _deb_data_member(archive_path: pathlib.Path) -> Optional[str]:
+    """Reads the .deb's ar headers to find the name of its data.tar member."""
+    try:
+        with open(archive_path, "rb") as f:
+            if f.read(8) != b"!<arch>\n":
+                return None
+            while True:
+                header = f.read(60)
+                if len(header) < 60:
+                    return None
+                name = header[:16].decode("ascii", "replace").strip().rstrip("/")
+                if name.startswith("data.tar"):
+                    return name
+                size = int(header[48:58])
+                f.seek(size + size % 2, 1)
+    except (OSError, ValueError):
+        return None
+
 
 @register_pm
 class APT(PackageManager):
@@ -17,33 +46,63 @@ class APT(PackageManager):
     def _check_command_path(self) -> str:
         return "apt-get"
 
-    def _check_command_args(self) -> List[str]:
-        return ["--version"]
-
     def get_download_command(
-        self, pkg_name_versioned: str, pkg_name_base: str, download_dir: pathlib.Path
+        self,
+        pkg_names_versioned: List[str],
+        pkg_names_base: List[str],
+        download_dir: pathlib.Path,
     ) -> List[str]:
         return [
             "apt-get",
             *self.pm_options,
             "download",
             "-o",
-            f"Dir::Cache::archives={download_dir.resolve()}",
-            pkg_name_versioned,
+            f"Dir::Cache::archives={download_dir}",
+            *pkg_names_versioned,
         ]
 
     def find_downloaded_archive(
-        self, download_dir: pathlib.Path, pkg_name_base: str
+        self, download_dir: pathlib.Path, pkg_name_base: str, exact_only: bool = False
     ) -> Optional[pathlib.Path]:
-        files = list(download_dir.glob(f"{pkg_name_base}_*.deb"))
-        if not files:
-            files = list(download_dir.glob(f"{pkg_name_base}*.deb"))
-        return files[0] if files else None
+        # name_version_arch.deb
+        return self._scan_archive(
+            download_dir,
+            pkg_name_base,
+            "_",
+            2,
+            (".deb",),
+            None if exact_only else pkg_name_base,
+        )
 
     def get_extract_command(
         self, archive_path: pathlib.Path, install_prefix: pathlib.Path
     ) -> Tuple[List[str], bool]:
         return (
-            ["dpkg", "-x", str(archive_path.resolve()), str(install_prefix.resolve())],
+            ["dpkg", "-x", str(archive_path), str(install_prefix)],
             False,
         )
+
+    def get_extract_pipeline(
+        self, archive_path: pathlib.Path, install_prefix: pathlib.Path
+    ) -> Optional[List[List[str]]]:
+        # Streaming only the payload out of the .deb skips dpkg's own startup;
+        # fall back to dpkg -x when the tools or a known payload are missing.
+        if not self._which("ar") or not self._which("tar"):
+            return None
+        data_member = _deb_data_member(archive_path)
+        if data_member not in _DATA_TAR_FLAGS:
+            return None
+        tar_flags, decompressor = _DATA_TAR_FLAGS[data_member]
+        if decompressor and not self._which(decompressor):
+            return None
+        return [
+            ["ar", "p", str(archive_path), data_member],
+            [
+                "tar",
+                "--no-same-owner",
+                "-x",
+                *tar_flags,
+                "-f",
+                "-",
+            ],
+        ]
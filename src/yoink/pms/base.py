@@ -1,28 +1,85 @@
 import abc
+import functools
+import os
 import pathlib
 import shutil
 import subprocess
-from typing import List, Optional, Tuple, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+_OS_ID_TO_PM = {
+    "debian": "apt",
+    "ubuntu": "apt",
+    "fedora": "dnf",
+    "rhel": "dnf",
+    "centos": "dnf",
+    "arch": "pacman",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _preferred_pm_name() -> Optional[str]:
+    """Guesses the native package manager from /etc/os-release ID/ID_LIKE."""
+    os_ids: List[str] = []
+    try:
+        with open("/etc/os-release") as f:
+            for line in f:
+                key, _, value = line.strip().partition("=")
+                if key in ("ID", "ID_LIKE"):
+                    os_ids.extend(value.strip("\"'").split())
+    except OSError:
+        return None
+    for os_id in os_ids:
+        if os_id in _OS_ID_TO_PM:
+            return _OS_ID_TO_PM[os_id]
+    return None
+
 
 class PackageManager(abc.ABC):
     """Abstract base class for package manager integrations."""
     _registered_pms: List[Type["PackageManager"]] = []
+    _registered_instances: List["PackageManager"] = []
+    _available_cache: Dict[str, bool] = {}
+    _active_cache: Optional["PackageManager"] = None
+    _which_cache: Dict[str, Optional[str]] = {}
 
     @classmethod
     def register(cls, pm_class: Type["PackageManager"]):
-        """Registers a package manager implementation."""
+        """
+        Registers a package manager implementation, keeping a single instance
+        of it ordered so the distro's native package manager is probed first.
+        """
         if pm_class not in cls._registered_pms:
             cls._registered_pms.append(pm_class)
+            cls._registered_instances.append(pm_class())
+            preferred = _preferred_pm_name()
+            cls._registered_instances.sort(key=lambda pm: pm.name != preferred)
 
     @staticmethod
     def get_active() -> Optional["PackageManager"]:
         """
         Checks available package managers and returns an instance of the first
-        active one found.
+        active one found. Setting YOINK_PM to a registered name (e.g. 'dnf')
+        selects that package manager without probing. The result is cached.
         """
-        for pm_class in PackageManager._registered_pms:
-            pm_instance = pm_class()
+        if PackageManager._active_cache is not None:
+            return PackageManager._active_cache
+
+        forced_name = os.environ.get("YOINK_PM")
+        if forced_name:
+            PackageManager._active_cache = PackageManager.get_registered(forced_name)
+            return PackageManager._active_cache
+
+        for pm_instance in PackageManager._registered_instances:
             if pm_instance.check_available():
+                PackageManager._active_cache = pm_instance
+                return pm_instance
+        return None
+
+    @staticmethod
+    def get_registered(name: str) -> Optional["PackageManager"]:
+        """Returns the registered package manager with the given name, unprobed."""
+        for pm_instance in PackageManager._registered_instances:
+            if pm_instance.name == name:
                 return pm_instance
         return None
 
@@ -48,16 +105,46 @@ class PackageManager(abc.ABC):
         """The command to check for availability (e.g., 'apt-get')."""
         pass
 
-    @abc.abstractmethod
     def _check_command_args(self) -> List[str]:
-        """Arguments for the availability check command (e.g., ['--version'])."""
-        pass
+        """
+        Arguments for the availability check command, only run when
+        YOINK_STRICT_PROBE is set.
+        """
+        return ["--version"]
 
     def check_available(self) -> bool:
-        """Checks if the package manager command is available and functional."""
-        cmd_path = shutil.which(self._check_command_path())
+        """
+        Checks if the package manager command is available and functional.
+        Results are cached per package manager for the lifetime of the process.
+        """
+        cached = PackageManager._available_cache.get(self.name)
+        if cached is None:
+            cached = self._probe_available()
+            PackageManager._available_cache[self.name] = cached
+        return cached
+
+    @staticmethod
+    def _which(cmd: str) -> Optional[str]:
+        """shutil.which, memoized per command name for the process lifetime."""
+        if cmd not in PackageManager._which_cache:
+            PackageManager._which_cache[cmd] = shutil.which(cmd)
+        return PackageManager._which_cache[cmd]
+
+    def _get_cmd_path(self) -> Optional[str]:
+        """The full path of the availability check command, if on PATH."""
+        return self._which(self._check_command_path())
+
+    def _probe_available(self) -> bool:
+        """
+        An executable binary on PATH (shutil.which only returns X_OK matches) is
+        trusted as functional. Set YOINK_STRICT_PROBE=1 to also run the
+        availability check command.
+        """
+        cmd_path = self._get_cmd_path()
         if not cmd_path:
             return False
+        if not os.environ.get("YOINK_STRICT_PROBE"):
+            return True
         try:
             subprocess.run(
                 [cmd_path] + self._check_command_args(),
@@ -71,16 +158,79 @@ class PackageManager(abc.ABC):
 
     @abc.abstractmethod
     def get_download_command(
-        self, pkg_name_versioned: str, pkg_name_base: str, download_dir: pathlib.Path
+        self,
+        pkg_names_versioned: List[str],
+        pkg_names_base: List[str],
+        download_dir: pathlib.Path,
     ) -> List[str]:
-        """Returns the command list to download a package."""
+        """
+        Returns the command list to download one or more packages at once.
+        download_dir is already resolved.
+        """
         pass
 
+    @staticmethod
+    def _scan_archive(
+        download_dir: pathlib.Path,
+        pkg_name_base: str,
+        separator: str,
+        field_count: int,
+        suffixes: Tuple[str, ...],
+        loose_prefix: Optional[str] = None,
+    ) -> Optional[pathlib.Path]:
+        """
+        Finds pkg_name_base's archive in download_dir with a single directory
+        scan. An exact match is the name, separator, then exactly field_count
+        separator-delimited fields (version, release, arch...) and a suffix, so
+        'foo' never claims 'foo-libs-1.0-1.x86_64.rpm'. Names merely starting
+        with loose_prefix are a fallback, if given. Exact matches and earlier
+        suffixes take priority; ties go to the newest file.
+        """
+        exact_prefix = pkg_name_base + separator
+        best_rank: Optional[Tuple[int, int]] = None
+        best_entry: Optional[os.DirEntry] = None
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                suffix_idx = next(
+                    (i for i, s in enumerate(suffixes) if name.endswith(s)), None
+                )
+                if suffix_idx is None:
+                    continue
+                fields = name[len(exact_prefix) : -len(suffixes[suffix_idx])]
+                if (
+                    name.startswith(exact_prefix)
+                    and fields
+                    and fields.count(separator) == field_count - 1
+                ):
+                    match_idx = 0
+                elif loose_prefix is not None and name.startswith(loose_prefix):
+                    match_idx = 1
+                else:
+                    continue
+                if not entry.is_file():
+                    continue
+                rank = (match_idx, suffix_idx)
+                if best_rank is None or rank < best_rank:
+                    best_rank, best_entry = rank, entry
+                elif (
+                    rank == best_rank
+                    and best_entry is not None
+                    and entry.stat().st_mtime > best_entry.stat().st_mtime
+                ):
+                    # Only ties need a stat; a fresh download dir rarely has any.
+                    best_entry = entry
+        return pathlib.Path(best_entry.path) if best_entry else None
+
     @abc.abstractmethod
     def find_downloaded_archive(
-        self, download_dir: pathlib.Path, pkg_name_base: str
+        self, download_dir: pathlib.Path, pkg_name_base: str, exact_only: bool = False
     ) -> Optional[pathlib.Path]:
-        """Finds the downloaded package archive file in the download directory."""
+        """
+        Finds the downloaded package archive file in the download directory.
+        exact_only disables the loose name fallback, for directories holding
+        other packages' archives too.
+        """
         pass
 
     @abc.abstractmethod
@@ -90,9 +240,20 @@ class PackageManager(abc.ABC):
         """
         Returns the command (list or string) to extract the archive
         and a boolean indicating if it's a shell command.
+        Both paths are already resolved.
         """
         pass
 
+    def get_extract_pipeline(
+        self, archive_path: pathlib.Path, install_prefix: pathlib.Path
+    ) -> Optional[List[List[str]]]:
+        """
+        Optionally returns extraction as a list of commands to run concurrently,
+        each piped into the next, from within install_prefix. When provided it
+        is used instead of get_extract_command, avoiding a shell.
+        """
+        return None
+
 
 def register_pm(cls: Type[PackageManager]) -> Type[PackageManager]:
     """Decorator to register a PackageManager implementation."""
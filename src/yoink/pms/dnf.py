@@ -21,32 +21,48 @@ class DNF(PackageManager):
     def _check_command_path(self) -> str:
         return "dnf"
 
-    def _check_command_args(self) -> List[str]:
-        return ["--version"]
-
     def get_download_command(
-        self, pkg_name_versioned: str, pkg_name_base: str, download_dir: pathlib.Path
+        self,
+        pkg_names_versioned: List[str],
+        pkg_names_base: List[str],
+        download_dir: pathlib.Path,
     ) -> List[str]:
         return [
             "dnf",
             *self.pm_options,
             "download",
-            f"--destdir={download_dir.resolve()}",
-            pkg_name_versioned,
+            f"--destdir={download_dir}",
+            *pkg_names_versioned,
         ]
 
     def find_downloaded_archive(
-        self, download_dir: pathlib.Path, pkg_name_base: str
+        self, download_dir: pathlib.Path, pkg_name_base: str, exact_only: bool = False
     ) -> Optional[pathlib.Path]:
-        files = list(download_dir.glob(f"{pkg_name_base}-*.rpm"))
-        if not files:
-            files = list(download_dir.glob(f"{pkg_name_base}*.rpm"))
-        return files[0] if files else None
+        # name-version-release.arch.rpm
+        return self._scan_archive(
+            download_dir,
+            pkg_name_base,
+            "-",
+            2,
+            (".rpm",),
+            None if exact_only else pkg_name_base,
+        )
 
     def get_extract_command(
         self, archive_path: pathlib.Path, install_prefix: pathlib.Path
     ) -> Tuple[str, bool]:
         return (
-            f'rpm2cpio "{archive_path.resolve()}" | (cd "{install_prefix.resolve()}" && cpio -idum --quiet)',
+            f'rpm2cpio "{archive_path}" | (cd "{install_prefix}" && cpio -idum --quiet)',
             True,
         )
+
+    def get_extract_pipeline(
+        self, archive_path: pathlib.Path, install_prefix: pathlib.Path
+    ) -> Optional[List[List[str]]]:
+        # Without either tool, the shell fallback reports the failure as a PM error.
+        if not self._which("rpm2cpio") or not self._which("cpio"):
+            return None
+        return [
+            ["rpm2cpio", str(archive_path)],
+            ["cpio", "-idum", "--quiet"],
+        ]
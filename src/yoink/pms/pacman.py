@@ -4,6 +4,8 @@ from typing import List, Optional, Tuple
 
 from .base import PackageManager, register_pm
 
+_IS_ROOT = os.geteuid() == 0
+
 
 @register_pm
 class Pacman(PackageManager):
@@ -22,15 +24,15 @@ class Pacman(PackageManager):
     def _check_command_path(self) -> str:
         return "pacman"
 
-    def _check_command_args(self) -> List[str]:
-        return ["--version"]
-
     def get_download_command(
-        self, pkg_name_versioned: str, pkg_name_base: str, download_dir: pathlib.Path
+        self,
+        pkg_names_versioned: List[str],
+        pkg_names_base: List[str],
+        download_dir: pathlib.Path,
     ) -> List[str]:
         cmd_prefix = []
 
-        if os.geteuid() != 0:
+        if not _IS_ROOT:
             cmd_prefix.append("sudo")
 
         return [
@@ -39,26 +41,29 @@ class Pacman(PackageManager):
             *self.pm_options,
             "-Sddp",
             "--cachedir",
-            str(download_dir.resolve()),
-            pkg_name_versioned,
+            str(download_dir),
+            *pkg_names_versioned,
         ]
 
     def find_downloaded_archive(
-        self, download_dir: pathlib.Path, pkg_name_base: str
+        self, download_dir: pathlib.Path, pkg_name_base: str, exact_only: bool = False
     ) -> Optional[pathlib.Path]:
-        extensions = [
+        extensions = (
             ".pkg.tar.zst",
             ".pkg.tar.xz",
             ".pkg.tar.gz",
             ".pkg.tar.bz2",
             ".pkg.tar",
-        ]
-        for ext_suffix in extensions:
-            files = list(download_dir.glob(f"{pkg_name_base}-*{ext_suffix}"))
-            if files:
-                files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                return files[0]
-        return None
+        )
+        # name-pkgver-pkgrel-arch.pkg.tar.*
+        return self._scan_archive(
+            download_dir,
+            pkg_name_base,
+            "-",
+            3,
+            extensions,
+            None if exact_only else f"{pkg_name_base}-",
+        )
 
     def get_extract_command(
         self, archive_path: pathlib.Path, install_prefix: pathlib.Path
@@ -66,10 +71,11 @@ class Pacman(PackageManager):
         return (
             [
                 "tar",
+                "--no-same-owner",
                 "-xf",
-                str(archive_path.resolve()),
+                str(archive_path),
                 "-C",
-                str(install_prefix.resolve()),
+                str(install_prefix),
             ],
             False,
         )
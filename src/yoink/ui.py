@@ -1,12 +1,74 @@
+import os
 import sys
-import time
 import threading
+import time
 from typing import Optional
 
+# Operations that finish within this window never draw a frame at all.
+_FIRST_FRAME_DELAY = 0.1
+
+
+class SpinnerService:
+    """
+    Owns the single long-lived thread that animates whichever Spinner is
+    attached, so successive spinners don't each start and join a thread.
+    """
+
+    _instance: Optional["SpinnerService"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active: Optional["Spinner"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def instance(cls) -> "SpinnerService":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def attach(self, spinner: "Spinner") -> None:
+        with self._cond:
+            self._active = spinner
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def detach(self, spinner: "Spinner") -> None:
+        # Frames are written with the lock held, so once it is acquired here
+        # no write for this spinner can still be in flight.
+        with self._cond:
+            if self._active is spinner:
+                self._active = None
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        greeted: Optional["Spinner"] = None
+        with self._cond:
+            while True:
+                spinner = self._active
+                if spinner is None:
+                    self._cond.wait()
+                    continue
+                if spinner is not greeted:
+                    greeted = spinner
+                    self._cond.wait(_FIRST_FRAME_DELAY)
+                    continue
+                spinner._draw_next_frame()
+                # Returns early when the spinner is detached or replaced.
+                self._cond.wait(spinner.delay)
+
+
 class Spinner:
-    """A simple CLI spinner with a yoinking theme that completes its cycle."""
+    """
+    A simple CLI spinner with a yoinking theme that stops as soon as asked.
+    Animation is driven by the shared SpinnerService thread.
+    """
 
-    def __init__(self, message="Yoinking...", delay=0.15, active_on_tty_only=True):
+    def __init__(self, message="Yoinking...", delay=0.2, active_on_tty_only=True):
         self.spinner_frames = [
             "🎣--~       ",
             "🎣---~      ",
@@ -28,38 +90,42 @@ class Spinner:
         self.delay = delay
         self.base_message = message
         self._running = False
-        self._stop_requested = False
-        self._cycle_complete_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
+        self._has_drawn = False
+        self._start_time = 0.0
+        self._last_render_time = 0.0
         self.active_on_tty_only = active_on_tty_only
         self.is_tty = sys.stdout.isatty()
         self.current_frame_idx = 0
         self._max_spinner_frame_len = max(len(s) for s in self.spinner_frames)
-
-    def _spin(self):
-        self.current_frame_idx = 0
-        while self._running:
-            if self._stop_requested and self.current_frame_idx == 0:
-                self._running = False
-                self._cycle_complete_event.set()
-                break
-
-            spinner_frame = self.spinner_frames[self.current_frame_idx]
-            output_line = f"\r{self.base_message} {spinner_frame}"
-
-            padding_len = self._max_spinner_frame_len - len(spinner_frame) + 2
-            padding = " " * padding_len
-            print(output_line + padding, end="")
-            sys.stdout.flush()
-
-            time.sleep(self.delay)
-            self.current_frame_idx = (self.current_frame_idx + 1) % len(
-                self.spinner_frames
-            )
-
-            if self.current_frame_idx == 0 and self._stop_requested:
-                self._running = False
-                self._cycle_complete_event.set()
+        # Pre-encoded so each tick is a single os.write, bypassing TextIOWrapper.
+        self._rendered_frames = [
+            (
+                "\r"
+                + self.base_message
+                + " "
+                + frame
+                + " " * (self._max_spinner_frame_len - len(frame) + 2)
+            ).encode("utf-8")
+            for frame in self.spinner_frames
+        ]
+        self._clear_line = (
+            "\r"
+            + " " * (len(self.base_message) + 1 + self._max_spinner_frame_len + 2)
+            + "\r"
+        ).encode("utf-8")
+        self._stdout_fd = 1
+
+    def _draw_next_frame(self):
+        now = time.monotonic()
+        # An early wake-up must not re-emit or rush the frame being shown.
+        if self._has_drawn and now - self._last_render_time < self.delay - 0.02:
+            return
+        self.current_frame_idx = int((now - self._start_time) / self.delay) % len(
+            self.spinner_frames
+        )
+        os.write(self._stdout_fd, self._rendered_frames[self.current_frame_idx])
+        self._last_render_time = now
+        self._has_drawn = True
 
     def start(self):
         if self.active_on_tty_only and not self.is_tty:
@@ -68,12 +134,14 @@ class Spinner:
             return
 
         if not self._running:
-            self._stop_requested = False
-            self._cycle_complete_event.clear()
+            # Anything still buffered must land before the raw frame writes.
+            sys.stdout.flush()
+            self._stdout_fd = sys.stdout.fileno()
             self._running = True
+            self._has_drawn = False
+            self._start_time = time.monotonic()
             self.current_frame_idx = 0
-            self._thread = threading.Thread(target=self._spin, daemon=True)
-            self._thread.start()
+            SpinnerService.instance().attach(self)
 
     def stop(
         self,
@@ -91,27 +159,11 @@ class Spinner:
             return
 
         if self._running:
-            if not self._stop_requested:
-                self._stop_requested = True
-
-            if self._thread and self._thread.is_alive():
-                timeout_duration = len(self.spinner_frames) * self.delay + 1.5
-                completed_gracefully = self._cycle_complete_event.wait(
-                    timeout=timeout_duration
-                )
-                if not completed_gracefully:
-                    self._running = False
-                    # Attempt to join briefly, but don't hang indefinitely
-                    if self._thread: # Check again as _thread could become None
-                        self._thread.join(timeout=0.2)
-
-
-            clear_line_len = (
-                len(self.base_message) + 1 + self._max_spinner_frame_len + 2
-            )
-            clear_line_str = "\r" + " " * clear_line_len + "\r"
-            print(clear_line_str, end="")
-            sys.stdout.flush()
+            SpinnerService.instance().detach(self)
+            self._running = False
+
+            if self._has_drawn:
+                os.write(self._stdout_fd, self._clear_line)
 
         final_char = success_char if success else failure_char
         if result_message:
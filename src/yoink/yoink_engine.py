@@ -1,20 +1,37 @@
 import os
 import pathlib
 import shutil
+import stat
 import subprocess
 import sys
+import tempfile
+import threading
 import traceback
+import uuid
 from typing import (
+    Dict,
     List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Union,
 )
 
-from .config import PACKAGE_CACHE_BASE
+from .config import PACKAGE_CACHE_BASE, PKG_NAME_SANITIZE_TABLE
 from .ui import Spinner
 from .pms.base import PackageManager
 
+# Resolved once at import; each yoink's download dir is named directly under it.
+_DOWNLOADS_ROOT = (PACKAGE_CACHE_BASE / "downloads").resolve()
+# Non-TTY status line templates, keyed on (succeeded, has a message).
+_PLAIN_STATUS = {
+    (True, True): " {}\n",
+    (True, False): " Done.\n",
+    (False, True): " {}\n",
+    (False, False): " Failed.\n",
+}
+
 
 def parse_package_spec(spec: str) -> Tuple[str, Optional[str]]:
     """Parses a package_spec string 'name[@version]' into (name, version)."""
@@ -35,114 +52,552 @@ def _run_cmd(
         cmd_str = " ".join(cmd) if isinstance(cmd, list) else cmd
         print(f"🔧 Running: {cmd_str}", file=sys.stderr)
 
-    return subprocess.run(
-        cmd,
-        capture_output=not verbose,
-        text=True,
-        check=check,
-        shell=is_shell_cmd,
-    )
+    if verbose:
+        return subprocess.run(cmd, text=True, check=check, shell=is_shell_cmd)
+
+    # Captured in temporary files rather than pipes, so a chatty command is
+    # neither held in memory while it runs nor blocked on a full pipe.
+    with tempfile.TemporaryFile(mode="w+") as stdout_file, tempfile.TemporaryFile(
+        mode="w+"
+    ) as stderr_file:
+        returncode = subprocess.run(
+            cmd, stdout=stdout_file, stderr=stderr_file, text=True, shell=is_shell_cmd
+        ).returncode
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        completed = subprocess.CompletedProcess(
+            cmd, returncode, stdout_file.read(), stderr_file.read()
+        )
+    if check:
+        completed.check_returncode()
+    return completed
+
+
+class _BackgroundCmd:
+    """
+    A command started immediately and reaped later with wait(), so the caller
+    can do other setup while it runs. Mirrors _run_cmd's output handling.
+    """
+
+    def __init__(self, cmd: List[str], verbose: bool):
+        if verbose:
+            print(f"🔧 Running: {' '.join(cmd)}", file=sys.stderr)
+        self.cmd = cmd
+        # Temporary files instead of pipes: nobody drains them until wait().
+        self._stdout = None if verbose else tempfile.TemporaryFile(mode="w+")
+        self._stderr = None if verbose else tempfile.TemporaryFile(mode="w+")
+        try:
+            self._proc = subprocess.Popen(
+                cmd, stdout=self._stdout, stderr=self._stderr, text=True
+            )
+        except BaseException:
+            self._close_outputs()
+            raise
+
+    def _close_outputs(self) -> None:
+        for output_file in (self._stdout, self._stderr):
+            if output_file is not None:
+                output_file.close()
+
+    def kill(self) -> None:
+        """Kills and reaps the command, for when the caller bails out early."""
+        self._proc.kill()
+        self._proc.wait()
+        self._close_outputs()
+
+    def wait(self) -> None:
+        """Waits for the command, raising CalledProcessError if it failed."""
+        returncode = self._proc.wait()
+        outputs = []
+        for output_file in (self._stdout, self._stderr):
+            if output_file is None:
+                outputs.append(None)
+                continue
+            output_file.seek(0)
+            outputs.append(output_file.read())
+            output_file.close()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, self.cmd, output=outputs[0], stderr=outputs[1]
+            )
+
+
+def _run_pipeline(
+    stages: List[List[str]], cwd: pathlib.Path, verbose: bool
+) -> None:
+    """
+    Runs commands concurrently with each stdout piped into the next stdin,
+    without a shell. Raises CalledProcessError for the first failing stage.
+    """
+    if verbose:
+        pipeline_str = " | ".join(" ".join(stage) for stage in stages)
+        print(f"🔧 Running: {pipeline_str} (in {cwd})", file=sys.stderr)
+
+    # A shared file rather than per-stage pipes, so no stage can block on a
+    # full stderr pipe while we wait on another.
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        procs: List[subprocess.Popen] = []
+        upstream = None
+        try:
+            for idx, stage in enumerate(stages):
+                is_last = idx == len(stages) - 1
+                proc = subprocess.Popen(
+                    stage,
+                    stdin=upstream,
+                    stdout=(None if verbose else subprocess.DEVNULL)
+                    if is_last
+                    else subprocess.PIPE,
+                    stderr=None if verbose else stderr_file,
+                    cwd=str(cwd),
+                )
+                if upstream is not None:
+                    upstream.close()
+                upstream = proc.stdout
+                procs.append(proc)
+        except BaseException:
+            # A later stage failed to start: don't leave the earlier ones running.
+            if upstream is not None:
+                upstream.close()
+            for started in procs:
+                started.kill()
+                started.wait()
+            raise
+
+        for proc, stage in zip(procs, stages):
+            if proc.wait() != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    proc.returncode, stage, stderr=stderr_file.read()
+                )
+
+
+_BIN_DIRS = ("bin", "usr/bin", "sbin", "usr/sbin", "usr/local/bin")
+
+
+def _subdir_names(path: str) -> Dict[str, bool]:
+    """
+    Maps the names of the directories directly inside path to whether they
+    are symlinks. Both come from the directory listing without extra stats
+    for plain directories.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {
+                entry.name: entry.is_symlink() for entry in entries if entry.is_dir()
+            }
+    except OSError:
+        return {}
+
+
+def find_present_subdirs(
+    root: pathlib.Path,
+    rel_dirs: Sequence[str],
+    listings: Optional[Dict[str, Dict[str, bool]]] = None,
+) -> List[str]:
+    """
+    Returns the real path of root/rel_dir for each of rel_dirs (POSIX-style
+    relative paths) that is an existing directory, keeping their order. root
+    must already be resolved. Each intermediate directory is scanned at most
+    once, candidates below a missing component cost nothing, and only paths
+    through a symlink are passed to realpath. Passing the same listings dict
+    to several calls shares those scans, as long as root is unchanged.
+    """
+    root_str = str(root)
+    if listings is None:
+        listings = {}
+
+    def lookup(rel_dir: str) -> Optional[bool]:
+        """Returns None if rel_dir is absent, else whether it crosses a symlink."""
+        parent, _, name = rel_dir.rpartition("/")
+        parent_is_link = lookup(parent) if parent else False
+        if parent_is_link is None:
+            return None
+        if parent not in listings:
+            listings[parent] = _subdir_names(os.path.join(root_str, parent))
+        is_link = listings[parent].get(name)
+        return None if is_link is None else parent_is_link or is_link
+
+    present_dirs = []
+    for rel_dir in rel_dirs:
+        crosses_link = lookup(rel_dir)
+        if crosses_link is None:
+            continue
+        full_path = os.path.join(root_str, rel_dir)
+        present_dirs.append(os.path.realpath(full_path) if crosses_link else full_path)
+    return present_dirs
+
+
+def find_bin_dirs(
+    prefix_path: pathlib.Path,
+    listings: Optional[Dict[str, Dict[str, bool]]] = None,
+) -> List[str]:
+    """
+    Returns the common bin directories present within a given prefix, in search
+    order. listings is passed through to find_present_subdirs.
+    """
+    return find_present_subdirs(prefix_path, _BIN_DIRS, listings)
 
 
 def find_executable_in_prefix(
-    prefix_path: pathlib.Path, command_name: str
+    prefix_path: pathlib.Path,
+    command_name: str,
+    bin_dirs: Optional[List[str]] = None,
 ) -> Optional[pathlib.Path]:
     """
     Searches for an executable in common bin directories within a given prefix.
+    Pass bin_dirs from find_bin_dirs to reuse an earlier scan.
     """
 
-    search_dirs = [
-        prefix_path / "bin",
-        prefix_path / "usr" / "bin",
-        prefix_path / "sbin",
-        prefix_path / "usr" / "sbin",
-        prefix_path / "usr" / "local" / "bin",
-        prefix_path,
-    ]
-    for directory in search_dirs:
-        if directory.is_dir():
-            executable_path = directory / command_name
-            if executable_path.is_file() and os.access(executable_path, os.X_OK):
-                return executable_path.resolve()
+    if bin_dirs is None:
+        bin_dirs = find_bin_dirs(prefix_path)
+    for directory in [*bin_dirs, str(prefix_path)]:
+        executable_path = os.path.join(directory, command_name)
+        # One stat answers both "regular file?" and "executable?".
+        try:
+            st = os.stat(executable_path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            return pathlib.Path(executable_path).resolve()
     return None
 
 
+def versioned_pkg_names(
+    pm: PackageManager, pkg_specs: List[Tuple[str, Optional[str]]]
+) -> List[str]:
+    """Returns the package names as the package manager expects them."""
+    return [
+        f"{name}{pm.version_separator}{version}" if version else name
+        for name, version in pkg_specs
+    ]
+
+
+def _marker_pkg_list(pkg_names_versioned: List[str]) -> str:
+    """
+    The marker's package line: the primary package, then the extras sorted,
+    so '-p a -p b' and '-p b -p a' (which share a prefix) share it too.
+    """
+    return " ".join(pkg_names_versioned[:1] + sorted(pkg_names_versioned[1:]))
+
+
+def read_yoinked_marker(
+    install_prefix: pathlib.Path,
+    pm_name: Optional[str] = None,
+    pkg_names_versioned: Optional[List[str]] = None,
+) -> Tuple[bool, Optional[pathlib.Path]]:
+    """
+    Reads the prefix's .yoinked marker with a single open, doubling as the
+    existence check. Returns whether the marker exists and the executable it
+    records, if that is still an executable file (None for legacy markers).
+    If pkg_names_versioned is given, the marker only counts when it was
+    written by pm_name for exactly those packages.
+    """
+    try:
+        recorded_lines = (install_prefix / ".yoinked").read_text().split("\n")
+    except OSError:
+        return False, None
+    if pkg_names_versioned is not None and recorded_lines[1:3] != [
+        pm_name,
+        _marker_pkg_list(pkg_names_versioned),
+    ]:
+        return False, None
+    recorded = recorded_lines[0].strip()
+    if recorded and os.path.isfile(recorded) and os.access(recorded, os.X_OK):
+        return True, pathlib.Path(recorded)
+    return True, None
+
+
+def _mkdir_leaf(path: pathlib.Path) -> None:
+    """
+    Creates path with a single mkdir, expecting its parent to exist already.
+    Falls back to creating the parents when the cache scaffold is missing.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
+# Directories this process already ensured exist, so repeat calls skip the mkdir.
+_DIRS_CREATED: Set[pathlib.Path] = set()
+
+
+def _write_marker(marker_path: pathlib.Path, content: str) -> None:
+    """
+    Writes the marker via a temporary file and os.replace, so a reader never
+    sees a half-written marker. Uses raw os calls to skip the file object.
+    """
+    tmp_path = f"{marker_path}.{os.getpid()}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, marker_path)
+
+
+def _empty_trash(trash_dir: pathlib.Path) -> None:
+    """Deletes everything in trash_dir, including leftovers from earlier runs."""
+    try:
+        with os.scandir(trash_dir) as entries:
+            victims = [entry.path for entry in entries]
+    except OSError:
+        return
+    for victim in victims:
+        shutil.rmtree(victim, ignore_errors=True)
+
+
+def discard_dir(path: pathlib.Path) -> None:
+    """
+    Moves a directory into the cache's trash and deletes it on a daemon thread,
+    keeping the recursive delete off the path to exec (or to a re-yoink).
+    Whatever the thread does not finish before exec is cleaned up by a later run.
+    """
+    trash_dir = PACKAGE_CACHE_BASE / ".trash"
+    try:
+        if trash_dir not in _DIRS_CREATED:
+            os.makedirs(trash_dir, exist_ok=True)
+            _DIRS_CREATED.add(trash_dir)
+        os.rename(path, trash_dir / uuid.uuid4().hex)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(target=_empty_trash, args=(trash_dir,), daemon=True).start()
+
+
+def _store_cached_archive(
+    key_dir: pathlib.Path, archive_file: pathlib.Path
+) -> pathlib.Path:
+    """
+    Moves a downloaded archive into its cache key dir and returns its new path.
+    The archive lands under a private temporary name first and is then
+    os.replace'd into place, and stale siblings are only dropped afterwards,
+    so concurrent yoinks of the same package never remove each other's file.
+    """
+    os.makedirs(key_dir, exist_ok=True)
+    cached_archive = key_dir / archive_file.name
+    tmp_archive = key_dir / f".{archive_file.name}.{os.getpid()}.{uuid.uuid4().hex}"
+    os.replace(archive_file, tmp_archive)
+    os.replace(tmp_archive, cached_archive)
+    with os.scandir(key_dir) as entries:
+        stale = [
+            entry.path
+            for entry in entries
+            if entry.name != cached_archive.name and not entry.name.startswith(".")
+        ]
+    for stale_path in stale:
+        try:
+            os.unlink(stale_path)
+        except IsADirectoryError:
+            shutil.rmtree(stale_path, ignore_errors=True)
+        except OSError:
+            pass
+    return cached_archive
+
+
+def _extract_archive(
+    pm: PackageManager,
+    archive_file: pathlib.Path,
+    install_prefix: pathlib.Path,
+    verbose: bool,
+) -> None:
+    """Extracts one archive into install_prefix, preferring the PM's pipeline."""
+    extract_pipeline = pm.get_extract_pipeline(archive_file, install_prefix)
+    if extract_pipeline:
+        _run_pipeline(extract_pipeline, install_prefix, verbose)
+    else:
+        extract_cmd, is_shell_cmd = pm.get_extract_command(archive_file, install_prefix)
+        _run_cmd(extract_cmd, verbose, is_shell_cmd=is_shell_cmd)
+
+
 def yoink_package(
     pm: PackageManager,
     pkg_name_base: str,
     pkg_version_requested: Optional[str],
     install_prefix: pathlib.Path,
     verbose: bool,
-) -> bool:
+    use_archive_cache: bool = True,
+) -> Tuple[bool, Optional[pathlib.Path]]:
     """
     Downloads and extracts a package using the given package manager.
-    Returns True on success, False on failure.
+    Returns whether it succeeded and the package's executable, if one was found.
     """
-    version_str = f"@{pkg_version_requested}" if pkg_version_requested else "(latest)"
-    base_yoink_message = f"Casting for {pkg_name_base}{version_str}"
+    return yoink_packages_batch(
+        pm,
+        [(pkg_name_base, pkg_version_requested)],
+        install_prefix,
+        verbose,
+        use_archive_cache,
+    )
+
+
+def yoink_packages_batch(
+    pm: PackageManager,
+    pkg_specs: List[Tuple[str, Optional[str]]],
+    install_prefix: pathlib.Path,
+    verbose: bool,
+    use_archive_cache: bool = True,
+) -> Tuple[bool, Optional[pathlib.Path]]:
+    """
+    Downloads several packages with a single package manager invocation and
+    extracts them all into install_prefix. Downloaded archives are kept under
+    PACKAGE_CACHE_BASE/archives and reused unless use_archive_cache is False.
+    Returns whether it succeeded and the first package's executable, if found,
+    so callers need not scan the prefix for it again.
+    """
+    # Resolved once here; package manager commands receive absolute paths as-is.
+    install_prefix = install_prefix.resolve()
+    install_prefix_str = str(install_prefix)
+    pkg_names_base = [name for name, _ in pkg_specs]
+    pkg_names_str = ", ".join(pkg_names_base)
+    spec_labels = [
+        f"{name}@{version}" if version else f"{name}(latest)"
+        for name, version in pkg_specs
+    ]
+    base_yoink_message = f"Casting for {', '.join(spec_labels)}"
 
     spinner_instance: Optional[Spinner] = None
     if not verbose and sys.stdout.isatty():
         spinner_instance = Spinner(message=f"🎣 {base_yoink_message}")
         spinner_instance.start()
     elif verbose:
-        print(f"🎣 {base_yoink_message} to {install_prefix.resolve()}")
+        print(f"🎣 {base_yoink_message} to {install_prefix_str}")
     else:
         print(f"🎣 {base_yoink_message} ...", end="", flush=True)
 
-    pkg_name_versioned = (
-        f"{pkg_name_base}{pm.version_separator}{pkg_version_requested}"
-        if pkg_version_requested
-        else pkg_name_base
+    pkg_names_versioned = versioned_pkg_names(pm, pkg_specs)
+
+    primary_name, primary_version = pkg_specs[0]
+    temp_download_dir_name = "_".join(
+        (
+            "yoink_dl",
+            pm.name,
+            primary_name.translate(PKG_NAME_SANITIZE_TABLE),
+            primary_version or "latest",
+            str(os.getpid()),
+            install_prefix.name,
+        )
     )
+    temp_download_dir = _DOWNLOADS_ROOT / temp_download_dir_name
 
-    temp_download_dir_name = f"yoink_dl_{pm.name}_{pkg_name_base.replace('/', '_')}_{pkg_version_requested or 'latest'}_{os.getpid()}_{pathlib.Path(install_prefix).name}"
-    temp_download_dir = (
-        PACKAGE_CACHE_BASE / "downloads" / temp_download_dir_name
-    ).resolve()
+    archive_key_dirs = {
+        name: PACKAGE_CACHE_BASE
+        / "archives"
+        / pm.name
+        / f"{name.translate(PKG_NAME_SANITIZE_TABLE)}@{version or 'latest'}"
+        for name, version in pkg_specs
+    }
 
     is_successful_yoink = False
+    executable_path: Optional[pathlib.Path] = None
     final_user_message = ""
+    # Plain wording for non-TTY output, where the themed one doesn't fit.
+    plain_user_message = ""
+
+    # Archive cache entries written by this call, dropped again if it fails.
+    new_cached_archives: List[pathlib.Path] = []
 
     try:
-        temp_download_dir.mkdir(parents=True, exist_ok=True)
+        archive_files: Dict[str, pathlib.Path] = {}
+        if use_archive_cache:
+            for pkg_name_base in pkg_names_base:
+                key_dir = archive_key_dirs[pkg_name_base]
+                cached_archive = (
+                    pm.find_downloaded_archive(key_dir, pkg_name_base, exact_only=True)
+                    if key_dir.is_dir()
+                    else None
+                )
+                if cached_archive:
+                    archive_files[pkg_name_base] = cached_archive
+            if verbose and archive_files:
+                print(f"📦 Reusing cached archives for {', '.join(archive_files)}")
 
-        if verbose:
-            print(f" reeling in the line (downloading {pkg_name_versioned})...")
-        download_cmd = pm.get_download_command(
-            pkg_name_versioned, pkg_name_base, temp_download_dir
-        )
-        _run_cmd(download_cmd, verbose)
+        to_download = [
+            (name, versioned)
+            for name, versioned in zip(pkg_names_base, pkg_names_versioned)
+            if name not in archive_files
+        ]
+        if to_download:
+            _mkdir_leaf(temp_download_dir)
 
-        archive_file = pm.find_downloaded_archive(temp_download_dir, pkg_name_base)
-        if not archive_file or not archive_file.exists():
-            is_successful_yoink = False
-            final_user_message = f"The line came back empty! (No archive for {pkg_name_base} in {temp_download_dir})"
             if verbose:
                 print(
-                    f"🔎 Checked in: {temp_download_dir}, found: {[item.name for item in temp_download_dir.iterdir() if item.is_file()]}",
-                    file=sys.stderr,
+                    f" reeling in the line (downloading {' '.join(v for _, v in to_download)})..."
                 )
+            download_cmd = pm.get_download_command(
+                [versioned for _, versioned in to_download],
+                [name for name, _ in to_download],
+                temp_download_dir,
+            )
+            download = _BackgroundCmd(download_cmd, verbose)
+            try:
+                # Done while the package manager loads its indexes and downloads.
+                _mkdir_leaf(install_prefix)
+            except BaseException:
+                # Don't leave the PM writing into a download dir about to go.
+                download.kill()
+                raise
+            download.wait()
         else:
-            if verbose:
-                print(f"📄 Got it! Archive: {archive_file.name}")
-                print(" unhooking the catch (extracting)...")
+            _mkdir_leaf(install_prefix)
 
-            install_prefix.mkdir(parents=True, exist_ok=True)
-            extract_cmd, is_shell_cmd = pm.get_extract_command(
-                archive_file, install_prefix
+        # With several packages in one download dir, a loose name match could
+        # claim another package's archive, so only exact matches count.
+        shared_download_dir = len(to_download) > 1
+        for pkg_name_base, _ in to_download:
+            archive_file = pm.find_downloaded_archive(
+                temp_download_dir, pkg_name_base, exact_only=shared_download_dir
             )
-            _run_cmd(extract_cmd, verbose, is_shell_cmd=is_shell_cmd)
+            if not archive_file:
+                final_user_message = f"The line came back empty! (No archive for {pkg_name_base} in {temp_download_dir})"
+                if verbose:
+                    with os.scandir(temp_download_dir) as entries:
+                        found_files = [entry.name for entry in entries if entry.is_file()]
+                    print(
+                        f"🔎 Checked in: {temp_download_dir}, found: {found_files}",
+                        file=sys.stderr,
+                    )
+                break
+            if not shared_download_dir and archive_file != pm.find_downloaded_archive(
+                temp_download_dir, pkg_name_base, exact_only=True
+            ):
+                # A loose match may be another package's archive; use it, but
+                # don't cache it under this package's name.
+                archive_files[pkg_name_base] = archive_file
+                continue
+            # Keep the archive so re-yoinking this version skips the download.
+            archive_files[pkg_name_base] = _store_cached_archive(
+                archive_key_dirs[pkg_name_base], archive_file
+            )
+            new_cached_archives.append(archive_files[pkg_name_base])
+        else:
+            # Sequential, in spec order: when packages ship the same path, the
+            # last one extracted wins, as with a normal install.
+            for pkg_name_base in pkg_names_base:
+                archive_file = archive_files[pkg_name_base]
+                if verbose:
+                    print(f"📄 Got it! Archive: {archive_file.name}")
+                    print(" unhooking the catch (extracting)...")
+                _extract_archive(pm, archive_file, install_prefix, verbose)
 
-            (install_prefix / ".yoinked").touch()
+            # Record where the primary command lives so cache hits can skip the
+            # scan, and what was installed so versioned requests can be reused.
+            executable_path = find_executable_in_prefix(install_prefix, primary_name)
+            _write_marker(
+                install_prefix / ".yoinked",
+                f"{executable_path or ''}\n{pm.name}\n{_marker_pkg_list(pkg_names_versioned)}\n",
+            )
             is_successful_yoink = True
-            final_user_message = f"Caught {pkg_name_base} from {pm.name}!"
+            final_user_message = f"Caught {pkg_names_str} from {pm.name}!"
             if verbose:
                 print(f"🎉 {final_user_message}")
 
     except subprocess.CalledProcessError as e:
         is_successful_yoink = False
-        final_user_message = f"Oops! The line snapped! (Error yoinking {pkg_name_base})"
+        final_user_message = f"Oops! The line snapped! (Error yoinking {pkg_names_str})"
+        plain_user_message = f"Failed (Error yoinking {pkg_names_str})"
         if verbose:
             print(f"😫 {final_user_message}", file=sys.stderr)
             cmd_str = " ".join(e.cmd) if isinstance(e.cmd, list) else e.cmd
@@ -166,12 +621,17 @@ def yoink_package(
     except Exception as e:
         is_successful_yoink = False
         final_user_message = (
-            f"A rogue wave hit! (Unexpected error yoinking {pkg_name_base})"
+            f"A rogue wave hit! (Unexpected error yoinking {pkg_names_str})"
         )
+        plain_user_message = f"Failed (Unexpected error yoinking {pkg_names_str})"
         if verbose:
             print(f"😫 {final_user_message}", file=sys.stderr)
             print(f"Error: {e}", file=sys.stderr)
-            traceback.print_exc(file=sys.stderr)
+            # Source lines are only read as each frame is written out.
+            for line in traceback.TracebackException.from_exception(
+                e, lookup_lines=False
+            ).format():
+                sys.stderr.write(line)
         else:
             print(f"\n😫 {final_user_message}", file=sys.stderr)
             print(
@@ -185,25 +645,32 @@ def yoink_package(
                 success=is_successful_yoink, result_message=final_user_message
             )
         elif not verbose and not sys.stdout.isatty():
-            if final_user_message:
-                print(
-                    f" {final_user_message if is_successful_yoink else final_user_message.replace('Oops! The line snapped!', 'Failed').replace('A rogue wave hit!', 'Failed')}"
+            status_message = plain_user_message or final_user_message
+            sys.stdout.write(
+                _PLAIN_STATUS[(is_successful_yoink, bool(status_message))].format(
+                    status_message
                 )
-            else:
-                print(" Done." if is_successful_yoink else " Failed.")
+            )
+
+        if not is_successful_yoink:
+            for cached_archive in new_cached_archives:
+                try:
+                    os.unlink(cached_archive)
+                except OSError:
+                    pass
 
         if not is_successful_yoink and install_prefix.exists():
             if verbose:
                 print(
-                    f"🗑️ Cleaning up failed installation attempt at {install_prefix}",
+                    f"🗑️ Cleaning up failed installation attempt at {install_prefix_str}",
                     file=sys.stderr,
                 )
-            shutil.rmtree(install_prefix, ignore_errors=True)
+            discard_dir(install_prefix)
 
         if temp_download_dir.exists():
-            shutil.rmtree(temp_download_dir, ignore_errors=True)
+            discard_dir(temp_download_dir)
 
-    return is_successful_yoink
+    return is_successful_yoink, executable_path if is_successful_yoink else None
 
 
 def purge_cache():